@@ -6,9 +6,13 @@
 """
 
 import os
+import copy
 import json
 import logging
 import base64
+import functools
+import threading
+from collections import deque
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -22,6 +26,15 @@ from cryptography.hazmat.backends import default_backend
 class ConfigManager:
     """配置管理器类，负责配置信息的加密存储和管理"""
     
+    # 最近文档列表的最大长度
+    MAX_RECENT_DOCUMENTS = 10
+    
+    # 配置写入的合并延迟（秒），频繁保存时最多每隔该时间写一次文件
+    FLUSH_DELAY = 0.5
+    
+    # 后台写入失败后的最大尝试次数，超过后保留配置等待退出时的flush
+    MAX_FLUSH_ATTEMPTS = 3
+    
     # 配置文件路径
     def __init__(self):
         """初始化配置管理器"""
@@ -35,6 +48,19 @@ class ConfigManager:
         # 确保应用数据目录存在
         os.makedirs(self.app_data_dir, exist_ok=True)
         
+        # 最近文档列表的内存缓存，首次使用时加载，保存配置时写回
+        self._recent_cache = None
+        
+        # 配置读取缓存，键为(路径, 修改时间, 大小)，保存配置时清空
+        self._load_cached = functools.lru_cache(maxsize=4)(self._load_config_file)
+        
+        # 尚未写入文件的配置，由flush在延迟后统一写入；
+        # 界面线程保存、监听线程读取、定时器线程写入共用同一把锁
+        self._lock = threading.RLock()
+        self._pending_config = None
+        self._flush_timer = None
+        self._flush_failures = 0
+        
         # 初始化加密密钥
         self.fernet = None
         self._initialize_encryption()
@@ -189,54 +215,156 @@ class ConfigManager:
     def load_config(self) -> Dict[str, Any]:
         """加载配置
         
+        有尚未写入文件的配置时直接返回该配置；配置文件未变化时（按修改时间和大小判断）
+        直接返回缓存结果，避免重复读取和解密。
+        
         Returns:
             Dict[str, Any]: 配置字典
         """
+        with self._lock:
+            if self._pending_config is not None:
+                return copy.deepcopy(self._pending_config)
+        
         self.logger.info(f"加载配置文件: {self.config_file}")
         
         # 如果配置文件不存在，返回默认配置
-        if not os.path.exists(self.config_file):
+        try:
+            stat = os.stat(self.config_file)
+        except FileNotFoundError:
             self.logger.warning("配置文件不存在，使用默认配置")
-            return self.default_config.copy()
+            return copy.deepcopy(self.default_config)
         
         try:
-            # 读取配置文件
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                config = json.load(f)
-            
-            # 解密敏感信息
-            if "api_key_encrypted" in config:
-                try:
-                    config["api_key"] = self.decrypt(config["api_key_encrypted"])
-                except Exception as e:
-                    self.logger.error(f"解密API密钥失败: {str(e)}")
-                    config["api_key"] = ""
-                # 移除加密后的字段
-                del config["api_key_encrypted"]
-            
-            # 合并默认配置，确保所有必要的配置项都存在
-            merged_config = self.default_config.copy()
-            merged_config.update(config)
-            
-            self.logger.info("配置加载成功")
-            return merged_config
+            config = self._load_cached(self.config_file, stat.st_mtime_ns, stat.st_size)
+            # 返回副本，调用方修改配置不会影响缓存
+            return copy.deepcopy(config)
             
         except json.JSONDecodeError as e:
             self.logger.error(f"解析配置文件失败: {str(e)}")
-            return self.default_config.copy()
+            return copy.deepcopy(self.default_config)
         except Exception as e:
             self.logger.error(f"加载配置失败: {str(e)}")
-            return self.default_config.copy()
+            return copy.deepcopy(self.default_config)
+    
+    def _load_config_file(self, config_file: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+        """读取并解密配置文件
+        
+        结果由_load_cached按(路径, 修改时间, 大小)缓存，不应直接修改返回值。
+        
+        Args:
+            config_file: 配置文件路径
+            mtime_ns: 配置文件修改时间（纳秒），仅作为缓存键
+            size: 配置文件大小，仅作为缓存键
+            
+        Returns:
+            Dict[str, Any]: 合并默认配置后的配置字典
+        """
+        # 读取配置文件
+        with open(config_file, "r", encoding="utf-8") as f:
+            config = json.load(f)
+        
+        # 解密敏感信息
+        if "api_key_encrypted" in config:
+            try:
+                config["api_key"] = self.decrypt(config["api_key_encrypted"])
+            except Exception as e:
+                self.logger.error(f"解密API密钥失败: {str(e)}")
+                config["api_key"] = ""
+            # 移除加密后的字段
+            del config["api_key_encrypted"]
+        
+        # 合并默认配置，确保所有必要的配置项都存在
+        merged_config = copy.deepcopy(self.default_config)
+        merged_config.update(config)
+        
+        self.logger.info("配置加载成功")
+        return merged_config
     
     def save_config(self, config: Dict[str, Any], update_recent: bool = True) -> bool:
         """保存配置
         
+        配置立即对load_config可见，文件在FLUSH_DELAY秒后由flush统一写入，
+        连续多次保存只写一次文件。需要立即落盘并确认结果时调用flush。
+        
         Args:
             config: 要保存的配置字典
-            update_recent: 是否更新最近文档列表（避免循环调用）
+            update_recent: 是否将document_path加入最近文档列表
+            
+        Returns:
+            bool: 配置是否已加入待写入队列，不代表已写入文件
+        """
+        try:
+            with self._lock:
+                # 更新最近使用的文档列表，与配置一起写入
+                if update_recent and "document_path" in config and config["document_path"]:
+                    self._update_recent_documents(config["document_path"])
+                
+                # 合并默认配置并复制，调用方之后修改配置不会影响待写入的内容
+                pending_config = copy.deepcopy(self.default_config)
+                pending_config.update(copy.deepcopy(config))
+                if self._recent_cache is not None:
+                    pending_config["recent_documents"] = list(self._recent_cache)
+                
+                self._pending_config = pending_config
+                self._flush_failures = 0
+                self._schedule_flush()
+            return True
             
+        except Exception as e:
+            self.logger.error(f"保存配置失败: {str(e)}")
+            return False
+    
+    def _schedule_flush(self):
+        """启动延迟写入定时器，已有等待中的写入时不重新计时"""
+        with self._lock:
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.FLUSH_DELAY, self._on_flush_timer)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _on_flush_timer(self):
+        """延迟写入定时器回调，失败时最多重试MAX_FLUSH_ATTEMPTS次"""
+        with self._lock:
+            if self.flush():
+                return
+            
+            self._flush_failures += 1
+            if self._flush_failures < self.MAX_FLUSH_ATTEMPTS:
+                self._schedule_flush()
+            else:
+                self.logger.error("配置多次写入失败，将在下次保存或退出时重试")
+    
+    def flush(self) -> bool:
+        """将尚未写入的配置立即写入文件
+        
+        写入失败时保留待写入的配置，下次保存或调用flush时重新写入。
+        
         Returns:
-            bool: 是否保存成功
+            bool: 是否写入成功，没有待写入的配置时返回True
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            if self._pending_config is None:
+                return True
+            
+            if not self._write_config_file(self._pending_config):
+                return False
+            
+            self._pending_config = None
+            self._flush_failures = 0
+            return True
+    
+    def _write_config_file(self, config: Dict[str, Any]) -> bool:
+        """加密敏感信息并将配置写入文件
+        
+        Args:
+            config: 要写入的配置字典
+            
+        Returns:
+            bool: 是否写入成功
         """
         self.logger.info(f"保存配置文件: {self.config_file}")
         temp_file = self.config_file + ".tmp"
@@ -264,9 +392,8 @@ class ConfigManager:
             else:  # Unix-like
                 os.replace(temp_file, self.config_file)
             
-            # 更新最近使用的文档列表（避免循环调用）
-            if update_recent and "document_path" in config and config["document_path"]:
-                self._update_recent_documents(config["document_path"])
+            # 配置文件已变化，下次读取时重新加载
+            self._load_cached.cache_clear()
             
             self.logger.info("配置保存成功")
             return True
@@ -278,34 +405,34 @@ class ConfigManager:
                 os.remove(temp_file)
             return False
     
+    def _get_recent_cache(self) -> deque:
+        """获取内存中的最近文档列表，首次调用时从配置加载
+        
+        Returns:
+            deque: 最近文档列表，最新的在最前
+        """
+        if self._recent_cache is None:
+            recent_docs = self.load_config().get("recent_documents", [])
+            self._recent_cache = deque(recent_docs, maxlen=self.MAX_RECENT_DOCUMENTS)
+        return self._recent_cache
+    
     def _update_recent_documents(self, document_path: str):
         """更新最近使用的文档列表
         
+        只修改内存中的列表，下次保存配置时一并写入文件。
+        
         Args:
             document_path: 文档路径
         """
         try:
-            # 加载当前配置
-            config = self.load_config()
-            recent_docs = config.get("recent_documents", [])
+            recent_docs = self._get_recent_cache()
             
             # 如果文档已存在，移除旧的条目
             if document_path in recent_docs:
                 recent_docs.remove(document_path)
             
-            # 添加到列表开头
-            recent_docs.insert(0, document_path)
-            
-            # 限制列表长度
-            max_recent = 10
-            if len(recent_docs) > max_recent:
-                recent_docs = recent_docs[:max_recent]
-            
-            # 更新配置
-            config["recent_documents"] = recent_docs
-            
-            # 保存配置，设置update_recent=False避免循环调用
-            self.save_config(config, update_recent=False)
+            # 添加到列表开头，超出长度限制的旧条目自动丢弃
+            recent_docs.appendleft(document_path)
             
         except Exception as e:
             self.logger.error(f"更新最近文档列表失败: {str(e)}")
@@ -356,14 +483,18 @@ class ConfigManager:
     def reset_config(self) -> bool:
         """重置配置到默认值
         
+        默认配置与save_config一样延迟写入文件。
+        
         Returns:
-            bool: 是否重置成功
+            bool: 默认配置是否已加入待写入队列，不代表已写入文件
         """
         self.logger.info("重置配置到默认值")
         
         try:
-            # 保存默认配置
-            return self.save_config(self.default_config.copy())
+            # 清空最近文档列表缓存并保存默认配置，两步在同一把锁内完成
+            with self._lock:
+                self._recent_cache = None
+                return self.save_config(self.default_config.copy())
         except Exception as e:
             self.logger.error(f"重置配置失败: {str(e)}")
             return False
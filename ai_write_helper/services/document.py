@@ -7,10 +7,44 @@
 
 import logging
 import os
+import re
 import tempfile
 from threading import RLock
 
 
+# 光标补写模式下文档中的插入位置标记
+CURSOR_MARKER = "[CURSOR]"
+_CURSOR_RE = re.compile(re.escape(CURSOR_MARKER))
+
+
+def find_cursor(text):
+    """查找光标标记的位置
+    
+    Args:
+        text: 文档文本
+        
+    Returns:
+        int: 光标标记的起始位置，未找到时返回-1
+    """
+    match = _CURSOR_RE.search(text)
+    return match.start() if match else -1
+
+
+def split_cursor(text):
+    """按第一个光标标记拆分文本
+    
+    Args:
+        text: 文档文本
+        
+    Returns:
+        tuple: (标记前文本, 标记后文本)，未找到标记时返回None
+    """
+    match = _CURSOR_RE.search(text)
+    if match is None:
+        return None
+    return text[:match.start()], text[match.end():]
+
+
 class DocumentService:
     """文档服务类，负责文档的读取和写入操作"""
     
@@ -338,11 +372,10 @@ class DocumentService:
         cursor_pos = self._get_cursor_position(target_path)
         
         # 查找光标标记 [CURSOR]，如果存在则在该位置插入
-        cursor_marker = "[CURSOR]"
-        if cursor_marker in existing_content:
+        if CURSOR_MARKER in existing_content:
             # 在光标标记位置插入内容
             self.logger.debug(f"在文本文件中找到光标标记，目标文件: {target_path}")
-            new_content = existing_content.replace(cursor_marker, content, 1)
+            new_content = existing_content.replace(CURSOR_MARKER, content, 1)
         elif cursor_pos != -1 and cursor_pos < len(existing_content):
             # 在获取到的光标位置插入内容
             self.logger.debug(f"在文本文件光标位置 {cursor_pos} 插入内容，目标文件: {target_path}")
@@ -398,27 +431,26 @@ class DocumentService:
                     # 查找包含光标标记的段落
                     cursor_found = False
                     for i, para in enumerate(doc.paragraphs):
-                        if "[CURSOR]" in para.text:
+                        # 分割段落文本
+                        cursor_parts = split_cursor(para.text)
+                        if cursor_parts is not None:
                             # 在包含光标标记的段落中插入内容
                             self.logger.debug(f"在Word文档中找到光标标记，目标文件: {target_path}")
-                            
-                            # 分割段落文本
-                            text = para.text
-                            cursor_pos = text.find("[CURSOR]")
+                            before_text, after_text = cursor_parts
                             
                             # 清除段落内容
                             para.clear()
                             
                             # 添加光标前的文本
-                            if cursor_pos > 0:
-                                para.add_run(text[:cursor_pos])
+                            if before_text:
+                                para.add_run(before_text)
                             
                             # 添加插入的内容
                             para.add_run(content)
                             
                             # 添加光标后的文本
-                            if cursor_pos + 8 < len(text):
-                                para.add_run(text[cursor_pos+8:])
+                            if after_text:
+                                para.add_run(after_text)
                             
                             cursor_found = True
                             break
@@ -5,6 +5,10 @@
 该模块实现应用程序的主配置窗口，包含API密钥设置、文档路径选择和主题提示词编辑功能。
 """
 
+import sys
+import time
+from typing import Dict, Final, NamedTuple
+
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QFileDialog,
@@ -13,7 +17,101 @@ from PyQt6.QtWidgets import (
     QScrollArea, QFrame, QDialog
 )
 from PyQt6.QtGui import QAction, QPainter, QBrush, QColor, QFont, QPen
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPoint, QRect
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPoint, QRect, QSignalBlocker
+
+
+# 文档选择对话框的文件过滤器
+_DOC_FILTERS = "所有文件 (*);;文本文件 (*.txt);;Markdown文件 (*.md);;Word文档 (*.docx)"
+
+# 帮助信息文本
+_USAGE_TEXT: Final[str] = """AI写作助手使用说明：
+
+1. 在API设置中输入AI服务API密钥并验证
+2. 在文档设置中选择目标文档和写入模式
+3. 在主题提示词中设置AI补写的方向和风格
+4. 保存配置后，在任意应用中选中文本并按下Enter键
+5. AI会自动生成补写内容并写入到目标文档中
+
+写入模式说明：
+- 增量写入：生成的内容会追加到文档末尾
+- 全量重写：生成的内容会替换整个文档
+- 光标补写：在文档中标记的光标位置插入内容，不改变其他内容
+  使用方法：在文档中需要插入内容的位置添加 [CURSOR] 标记
+  例如："这是一个测试[CURSOR]文档"
+  AI会在[CURSOR]标记处插入生成的内容，并移除该标记
+"""
+
+_ABOUT_TEXT: Final[str] = """AI写作助手 v1.0.0
+
+一个基于AI的划词补写工具，支持TXT，Word和Markdown文档。
+
+功能特点：
+- 全局监听文本选择和Enter键事件
+- 支持多种文档格式
+- 可配置写入模式
+- 支持自定义主题提示词
+"""
+
+_CONTACT_TEXT: Final[str] = """联系方式：
+
+如有问题或建议，欢迎联系我们：
+- 邮箱：508125305@qq.com
+"""
+
+
+class PromptTemplate(NamedTuple):
+    """提示词模板"""
+    category: str
+    description: str
+    content: str
+
+
+# 内置提示词模板
+_PROMPT_TEMPLATES = (
+    PromptTemplate(
+        category="科技论文",
+        description="科技论文风格，注重数据分析和逻辑推理",
+        content="请以科技论文风格重写文档，注重数据分析和逻辑推理，使用专业术语，结构清晰，论证严谨。"
+    ),
+    PromptTemplate(
+        category="商业报告",
+        description="商业报告风格，突出结论和行动建议",
+        content="请以商业报告风格重写文档，突出结论和行动建议，语言简洁明了，重点突出，具有说服力。"
+    ),
+    PromptTemplate(
+        category="创意写作",
+        description="创意写作风格，使用生动的描述和比喻",
+        content="请以创意写作风格重写文档，使用生动的描述和比喻，语言富有表现力，情节引人入胜。"
+    ),
+    PromptTemplate(
+        category="学术论文",
+        description="学术论文风格，严谨规范，引用准确",
+        content="请以学术论文风格重写文档，严谨规范，引用准确，结构完整，论点明确，论据充分。"
+    ),
+    PromptTemplate(
+        category="新闻报道",
+        description="新闻报道风格，客观公正，时效性强",
+        content="请以新闻报道风格重写文档，客观公正，时效性强，语言简洁，信息量大，结构清晰。"
+    ),
+    PromptTemplate(
+        category="产品描述",
+        description="产品描述风格，突出产品特点和优势",
+        content="请以产品描述风格重写文档，突出产品特点和优势，语言生动，具有吸引力，能够激发购买欲望。"
+    ),
+    PromptTemplate(
+        category="技术文档",
+        description="技术文档风格，准确详细，易于理解",
+        content="请以技术文档风格重写文档，准确详细，易于理解，结构清晰，步骤明确，便于操作。"
+    ),
+    PromptTemplate(
+        category="营销文案",
+        description="营销文案风格，富有感染力，促进转化",
+        content="请以营销文案风格重写文档，富有感染力，语言生动，能够吸引目标受众，促进转化。"
+    ),
+)
+
+# 按分类索引的提示词模板
+_PROMPT_BY_CATEGORY = {template.category: template for template in _PROMPT_TEMPLATES}
 
 
 class MinimizeBall(QWidget):
@@ -25,6 +123,12 @@ class MinimizeBall(QWidget):
     STATUS_COMPLETED = "completed"
     STATUS_ERROR = "error"
     
+    # 球的直径（像素），窗口尺寸固定
+    BALL_SIZE = 60
+    
+    # 进度文字字体，所有实例共用，在首次创建实例时初始化
+    _FONT = None
+    
     # 信号定义
     clicked = pyqtSignal()  # 点击信号
     
@@ -34,17 +138,47 @@ class MinimizeBall(QWidget):
         # 设置窗口属性
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.Tool)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.setFixedSize(60, 60)
+        self.setFixedSize(self.BALL_SIZE, self.BALL_SIZE)
+        
+        # 绘制几何参数（窗口尺寸固定，只需计算一次）
+        self._radius = self.BALL_SIZE // 2
+        self._highlight_radius = self._radius // 2
+        self._center = QPoint(self._radius, self._radius)
+        # 进度文字所在的横条区域，仅文字变化时只重绘该区域
+        self._text_rect = QRect(0, self.BALL_SIZE // 4, self.BALL_SIZE, self.BALL_SIZE // 2)
+        
+        # 绘制颜色、画刷、画笔和字体（只创建一次，处理中颜色在绘制时原地修改）
+        self._standby_brush = QBrush(QColor(76, 175, 80, 230))
+        self._status_brushes = {
+            self.STATUS_STANDBY: self._standby_brush,
+            self.STATUS_PROCESSING: self._standby_brush,
+            self.STATUS_COMPLETED: QBrush(QColor(46, 204, 113, 230)),
+            self.STATUS_ERROR: QBrush(QColor(231, 76, 60, 230)),
+        }
+        self._processing_color = QColor(76, 175, 80, 230)
+        self._processing_brush = QBrush(self._processing_color)
+        self._highlight_brush = QBrush(QColor(255, 255, 255, 40))
+        self._pen_none = QPen(Qt.PenStyle.NoPen)
+        self._text_pen = QPen(QColor(255, 255, 255))
+        if MinimizeBall._FONT is None:
+            MinimizeBall._FONT = QFont("微软雅黑", 12, QFont.Weight.Bold)
         
         # 进度信息
         self.progress_text = ""
-        self.progress_timer = QTimer(self)
-        self.progress_timer.setSingleShot(True)
-        self.progress_timer.timeout.connect(self.clear_progress)
+        # 实际显示的文字（限制为3个字符），只在进度信息变化时更新
+        self._display_text = ""
+        # 进度信息过期时间（单调时钟纳秒），由动画定时器检查
+        self._progress_expiry_ns = 0
+        
+        # 待合并的重绘区域，为None表示没有待执行的重绘
+        self._pending_update_rect = None
         
         # 鼠标事件
-        self.mouse_press_pos = None
-        self.mouse_move_pos = None
+        self._press_widget_pos = None
+        self._press_screen_x = 0
+        self._press_screen_y = 0
+        self._last_screen_x = 0
+        self._last_screen_y = 0
         
         # 状态管理
         self.status = self.STATUS_STANDBY
@@ -53,31 +187,55 @@ class MinimizeBall(QWidget):
         self.status_timer.timeout.connect(self.reset_to_standby)
         
         # 动画效果（极简版）
+        # 定时器只在处理中动画或进度信息待过期时运行，空闲时不重绘
         self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self.update)
-        self.animation_timer.start(50)  # 20fps动画，足够流畅且不影响性能
+        self.animation_timer.setInterval(50)  # 20fps动画，足够流畅且不影响性能
+        self.animation_timer.timeout.connect(self._on_animation_tick)
         self.animation_offset = 0
+        # 处理中动画的红色分量查找表，对应128帧循环
+        self._brightness_lut = bytes(50 + (i >> 1) for i in range(128))
         
         # 动态效果开关
         self.dynamic_effects_enabled = True
     
-    def set_status(self, status):
-        """设置状态
+    def _apply_status(self, status):
+        """更新状态并处理最终状态的恢复计时，不触发重绘
         
         Args:
             status: 状态值
+            
+        Returns:
+            bool: 是否需要重绘整个球
         """
+        is_final = status in [self.STATUS_COMPLETED, self.STATUS_ERROR]
+        
+        # 状态未变化且无需重新计时，不必重绘
+        if status == self.status and not is_final:
+            return False
+        
         self.status = status
         
         # 如果是完成或错误状态，1秒后恢复到待机状态
-        if status in [self.STATUS_COMPLETED, self.STATUS_ERROR]:
+        if is_final:
             self.status_timer.start(1000)
+        return True
+    
+    def set_status(self, status):
+        """设置状态
         
-        self.update()
+        Args:
+            status: 状态值
+        """
+        if not self._apply_status(status):
+            return
+        
+        self._sync_animation_timer()
+        self._schedule_update()
     
     def reset_to_standby(self):
         """重置到待机状态"""
         self.status = self.STATUS_STANDBY
+        self._sync_animation_timer()
         self.update()
     
     def set_dynamic_effects(self, enabled):
@@ -86,90 +244,131 @@ class MinimizeBall(QWidget):
         Args:
             enabled: 是否启用动态效果
         """
+        if enabled == self.dynamic_effects_enabled:
+            return
+        
         self.dynamic_effects_enabled = enabled
+        self._sync_animation_timer()
         self.update()
     
+    def _is_animating(self):
+        """是否需要播放处理中动画"""
+        return self.status == self.STATUS_PROCESSING and self.dynamic_effects_enabled
+    
+    def _sync_animation_timer(self):
+        """根据当前状态启动或停止动画定时器，隐藏时不运行"""
+        if self.isVisible() and (self._is_animating() or self.progress_text):
+            if not self.animation_timer.isActive():
+                self.animation_timer.start()
+        elif self.animation_timer.isActive():
+            self.animation_timer.stop()
+    
+    def _on_animation_tick(self):
+        """动画定时器回调，推进动画并清除过期的进度信息"""
+        if self.progress_text and time.monotonic_ns() >= self._progress_expiry_ns:
+            self._set_progress_text("")
+            self.update(self._text_rect)
+        
+        if self._is_animating():
+            # 更新动画偏移
+            self.animation_offset = (self.animation_offset + 1) & 127
+            self.update()
+        
+        self._sync_animation_timer()
+    
     def paintEvent(self, event):
-        """绘制最小化球"""
+        """绘制最小化球
+        
+        透明窗口会先清空待重绘区域，而文字区域与高光重叠，
+        因此背景圆和高光始终需要绘制，只有文字按待重绘区域跳过。
+        """
+        dirty_rect = event.rect()
         painter = QPainter(self)
+        # 只绘制圆形和文字，不需要SmoothPixmapTransform；
+        # 如果以后在球内绘制图片，在对应绘制调用处单独开启
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-        
-        # 绘制圆形背景
-        center = self.rect().center()
-        radius = self.width() // 2
         
         # 根据状态设置颜色
-        if self.status == self.STATUS_STANDBY:
-            # 待机状态：静态绿色
-            bg_color = QColor(76, 175, 80, 230)
-        elif self.status == self.STATUS_PROCESSING:
+        if self._is_animating():
             # 处理中状态：缓慢闪烁绿色
-            if self.dynamic_effects_enabled:
-                # 极简动画：颜色亮度变化，增加变化范围，使效果更明显
-                brightness = 50 + (self.animation_offset % 100) // 2
-                bg_color = QColor(brightness, 175, 80, 230)
-            else:
-                bg_color = QColor(76, 175, 80, 230)
-        elif self.status == self.STATUS_COMPLETED:
-            # 完成状态：亮绿色
-            bg_color = QColor(46, 204, 113, 230)
-        elif self.status == self.STATUS_ERROR:
-            # 错误状态：红色
-            bg_color = QColor(231, 76, 60, 230)
+            # 极简动画：颜色亮度变化，增加变化范围，使效果更明显
+            self._processing_color.setRed(self._brightness_lut[self.animation_offset])
+            self._processing_brush.setColor(self._processing_color)
+            bg_brush = self._processing_brush
         else:
-            # 默认状态
-            bg_color = QColor(76, 175, 80, 230)
+            # 其余状态使用固定颜色，未知状态按待机处理
+            bg_brush = self._status_brushes.get(self.status, self._standby_brush)
         
         # 绘制背景
-        painter.setBrush(QBrush(bg_color))
-        painter.setPen(QPen(Qt.PenStyle.NoPen))
-        painter.drawEllipse(center, radius, radius)
+        painter.setBrush(bg_brush)
+        painter.setPen(self._pen_none)
+        painter.drawEllipse(self._center, self._radius, self._radius)
         
         # 高光效果（增强立体感）
-        highlight_brush = QBrush(QColor(255, 255, 255, 40))
-        painter.setBrush(highlight_brush)
-        painter.drawEllipse(center, radius // 2, radius // 2)
+        painter.setBrush(self._highlight_brush)
+        painter.drawEllipse(self._center, self._highlight_radius, self._highlight_radius)
         
         # 绘制进度文字
-        if self.progress_text:
-            # 限制为3个字符
-            display_text = self.progress_text[:3]
-            painter.setPen(QColor(255, 255, 255))
-            painter.setFont(QFont("微软雅黑", 12, QFont.Weight.Bold))
-            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, display_text)
-        
-        # 更新动画偏移
-        self.animation_offset = (self.animation_offset + 1) % 100
+        if self._display_text and dirty_rect.intersects(self._text_rect):
+            painter.setPen(self._text_pen)
+            painter.setFont(MinimizeBall._FONT)
+            painter.drawText(self._text_rect, Qt.AlignmentFlag.AlignCenter, self._display_text)
     
     def mousePressEvent(self, event):
         """鼠标按下事件"""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.mouse_press_pos = event.globalPosition().toPoint()
-            self.mouse_move_pos = event.globalPosition().toPoint()
+            # 记录按下时的屏幕坐标和窗口位置，拖动时直接按总位移计算新位置
+            global_pos = event.globalPosition()
+            self._press_screen_x = int(global_pos.x())
+            self._press_screen_y = int(global_pos.y())
+            self._last_screen_x = self._press_screen_x
+            self._last_screen_y = self._press_screen_y
+            self._press_widget_pos = self.pos()
         elif event.button() == Qt.MouseButton.RightButton:
             # 右键点击展开窗口
             self.clicked.emit()
     
     def mouseMoveEvent(self, event):
         """鼠标移动事件"""
-        if event.buttons() == Qt.MouseButton.LeftButton and self.mouse_press_pos:
-            current_pos = event.globalPosition().toPoint()
-            delta = current_pos - self.mouse_move_pos
-            self.move(self.pos() + delta)
-            self.mouse_move_pos = current_pos
+        if event.buttons() == Qt.MouseButton.LeftButton and self._press_widget_pos is not None:
+            global_pos = event.globalPosition()
+            self._last_screen_x = int(global_pos.x())
+            self._last_screen_y = int(global_pos.y())
+            self.move(self._press_widget_pos + QPoint(
+                self._last_screen_x - self._press_screen_x,
+                self._last_screen_y - self._press_screen_y
+            ))
     
     def mouseReleaseEvent(self, event):
         """鼠标释放事件"""
         if event.button() == Qt.MouseButton.LeftButton:
             # 检查是否是点击事件（移动距离很小）
-            if self.mouse_press_pos and self.mouse_move_pos:
-                delta = self.mouse_move_pos - self.mouse_press_pos
-                if abs(delta.x()) < 5 and abs(delta.y()) < 5:
+            if self._press_widget_pos is not None:
+                if (abs(self._last_screen_x - self._press_screen_x) < 5
+                        and abs(self._last_screen_y - self._press_screen_y) < 5):
                     # 点击事件，展开窗口
                     self.clicked.emit()
-            self.mouse_press_pos = None
-            self.mouse_move_pos = None
+            self._press_widget_pos = None
+    
+    def _set_progress_text(self, text):
+        """更新进度信息及其显示文字
+        
+        Args:
+            text: 进度文字
+        """
+        self.progress_text = text
+        # 限制为3个字符
+        self._display_text = text[:3]
+    
+    def _apply_progress(self, text, duration):
+        """更新进度信息并设置过期时间，不触发重绘
+        
+        Args:
+            text: 进度文字
+            duration: 显示时长（毫秒）
+        """
+        self._set_progress_text(text)
+        self._progress_expiry_ns = time.monotonic_ns() + duration * 1_000_000
     
     def set_progress(self, text, duration=1000):
         """设置进度信息
@@ -178,14 +377,62 @@ class MinimizeBall(QWidget):
             text: 进度文字
             duration: 显示时长（毫秒）
         """
-        self.progress_text = text
-        self.update()
-        self.progress_timer.start(duration)
+        self._apply_progress(text, duration)
+        self._sync_animation_timer()
+        self._schedule_update(self._text_rect)
+    
+    def set_progress_status(self, text, status, duration=1000):
+        """同时设置进度信息和状态，只触发一次重绘
+        
+        Args:
+            text: 进度文字
+            status: 状态值
+            duration: 进度文字显示时长（毫秒）
+        """
+        self._apply_progress(text, duration)
+        status_changed = self._apply_status(status)
+        
+        self._sync_animation_timer()
+        # 状态未变化时只需重绘文字区域
+        self._schedule_update(None if status_changed else self._text_rect)
     
     def clear_progress(self):
         """清除进度信息"""
-        self.progress_text = ""
-        self.update()
+        self._set_progress_text("")
+        self._sync_animation_timer()
+        self._schedule_update(self._text_rect)
+    
+    def _schedule_update(self, rect=None):
+        """合并短时间内的多次重绘请求，待事件队列处理完后统一重绘
+        
+        Args:
+            rect: 需要重绘的区域，为None时重绘整个球
+        """
+        if rect is None:
+            rect = self.rect()
+        
+        if self._pending_update_rect is None:
+            self._pending_update_rect = QRect(rect)
+            QTimer.singleShot(0, self._flush_update)
+        else:
+            self._pending_update_rect = self._pending_update_rect.united(rect)
+    
+    def _flush_update(self):
+        """执行合并后的重绘"""
+        rect = self._pending_update_rect
+        self._pending_update_rect = None
+        if rect is not None:
+            self.update(rect)
+    
+    def showEvent(self, event):
+        """显示事件，按需恢复动画定时器"""
+        super().showEvent(event)
+        self._sync_animation_timer()
+    
+    def hideEvent(self, event):
+        """隐藏事件，停止动画定时器"""
+        super().hideEvent(event)
+        self.animation_timer.stop()
     
     def show_ball(self):
         """显示最小化球"""
@@ -202,6 +449,76 @@ class MainWindow(QMainWindow):
     # 信号定义
     config_saved = pyqtSignal()
     
+    # 进度文本关键字到最小化球状态的映射，按顺序匹配
+    _STATUS_KEYWORDS = (
+        (("处理中", "生成中", "写入中"), MinimizeBall.STATUS_PROCESSING),
+        (("已完成", "成功"), MinimizeBall.STATUS_COMPLETED),
+        (("已失败", "错误"), MinimizeBall.STATUS_ERROR),
+    )
+    
+    # 主窗口样式表，只解析一次
+    MAIN_QSS = """
+    QTabWidget#mainTabs::pane {
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        background: white;
+    }
+    QTabWidget#mainTabs QTabBar::tab {
+        background: #f0f0f0;
+        border: 1px solid #ccc;
+        border-bottom-color: #ccc;
+        border-radius: 4px 4px 0 0;
+        padding: 3px 8px;
+        margin-right: 1px;
+        font-size: 11px;
+    }
+    QTabWidget#mainTabs QTabBar::tab:selected {
+        background: white;
+        border-bottom-color: white;
+    }
+    #fieldLabel, #fieldInput {
+        font-size: 11px;
+    }
+    #sectionTitle {
+        font-weight: bold;
+        font-size: 11px;
+    }
+    #smallButton {
+        font-size: 10px;
+    }
+    #apiStatusLabel {
+        font-size: 10px;
+        color: #666;
+    }
+    #helpButton {
+        font-size: 12px;
+    }
+    QPushButton#minimizeButton, QPushButton#saveButton {
+        color: white;
+        border: none;
+        border-radius: 3px;
+        padding: 5px 10px;
+        font-size: 12px;
+    }
+    QPushButton#minimizeButton {
+        background-color: #2196F3;
+    }
+    QPushButton#minimizeButton:hover {
+        background-color: #1976D2;
+    }
+    QPushButton#saveButton {
+        background-color: #4CAF50;
+    }
+    QPushButton#saveButton:hover {
+        background-color: #45a049;
+    }
+    """
+    
+    # 提示词模板弹窗样式
+    _CATEGORY_CSS = "font-size: 10px;"
+    _CONTENT_CSS = "font-size: 10px; background-color: #f5f5f5; padding: 5px; border-radius: 3px;"
+    _COPY_BTN_CSS = "font-size: 9px; background-color: #2196F3; color: white; border: none; border-radius: 3px;"
+    
     def __init__(self, config_manager, api_service, document_service):
         """初始化主窗口
         
@@ -230,49 +547,21 @@ class MainWindow(QMainWindow):
         self.minimize_ball = MinimizeBall()
         self.minimize_ball.clicked.connect(self.restore_from_ball)
         
+        # 文档选择对话框（首次浏览时创建，之后复用）
+        self._file_dialog = None
+        
+        # 帮助信息弹窗（按需创建，之后复用）
+        self._msg_boxes: Dict[str, QMessageBox] = {}
+        
+        # 提示词模板弹窗（首次打开时创建，之后复用）
+        self._templates_dialog = None
+        
+        # 进度更新节流（毫秒），避免高频信号占满界面线程
+        self._progress_throttle_ms = 33
+        self._last_progress_ts = 0.0
+        
         # 提示词模板数据
-        self.prompt_templates = [
-            {
-                "category": "科技论文",
-                "description": "科技论文风格，注重数据分析和逻辑推理",
-                "content": "请以科技论文风格重写文档，注重数据分析和逻辑推理，使用专业术语，结构清晰，论证严谨。"
-            },
-            {
-                "category": "商业报告",
-                "description": "商业报告风格，突出结论和行动建议",
-                "content": "请以商业报告风格重写文档，突出结论和行动建议，语言简洁明了，重点突出，具有说服力。"
-            },
-            {
-                "category": "创意写作",
-                "description": "创意写作风格，使用生动的描述和比喻",
-                "content": "请以创意写作风格重写文档，使用生动的描述和比喻，语言富有表现力，情节引人入胜。"
-            },
-            {
-                "category": "学术论文",
-                "description": "学术论文风格，严谨规范，引用准确",
-                "content": "请以学术论文风格重写文档，严谨规范，引用准确，结构完整，论点明确，论据充分。"
-            },
-            {
-                "category": "新闻报道",
-                "description": "新闻报道风格，客观公正，时效性强",
-                "content": "请以新闻报道风格重写文档，客观公正，时效性强，语言简洁，信息量大，结构清晰。"
-            },
-            {
-                "category": "产品描述",
-                "description": "产品描述风格，突出产品特点和优势",
-                "content": "请以产品描述风格重写文档，突出产品特点和优势，语言生动，具有吸引力，能够激发购买欲望。"
-            },
-            {
-                "category": "技术文档",
-                "description": "技术文档风格，准确详细，易于理解",
-                "content": "请以技术文档风格重写文档，准确详细，易于理解，结构清晰，步骤明确，便于操作。"
-            },
-            {
-                "category": "营销文案",
-                "description": "营销文案风格，富有感染力，促进转化",
-                "content": "请以营销文案风格重写文档，富有感染力，语言生动，能够吸引目标受众，促进转化。"
-            }
-        ]
+        self.prompt_templates = _PROMPT_TEMPLATES
         
         # 初始化UI
         self.init_ui()
@@ -305,49 +594,46 @@ class MainWindow(QMainWindow):
     
     def show_usage(self):
         """显示使用说明"""
-        usage_text = """AI写作助手使用说明：
-
-1. 在API设置中输入AI服务API密钥并验证
-2. 在文档设置中选择目标文档和写入模式
-3. 在主题提示词中设置AI补写的方向和风格
-4. 保存配置后，在任意应用中选中文本并按下Enter键
-5. AI会自动生成补写内容并写入到目标文档中
-
-写入模式说明：
-- 增量写入：生成的内容会追加到文档末尾
-- 全量重写：生成的内容会替换整个文档
-- 光标补写：在文档中标记的光标位置插入内容，不改变其他内容
-  使用方法：在文档中需要插入内容的位置添加 [CURSOR] 标记
-  例如："这是一个测试[CURSOR]文档"
-  AI会在[CURSOR]标记处插入生成的内容，并移除该标记
-"""
-        QMessageBox.information(self, "使用说明", usage_text)
+        self._show_info("usage", "使用说明", _USAGE_TEXT)
     
     def show_about(self):
         """显示关于信息"""
-        about_text = """AI写作助手 v1.0.0
-
-一个基于AI的划词补写工具，支持TXT，Word和Markdown文档。
-
-功能特点：
-- 全局监听文本选择和Enter键事件
-- 支持多种文档格式
-- 可配置写入模式
-- 支持自定义主题提示词
-"""
-        QMessageBox.information(self, "关于", about_text)
+        self._show_info("about", "关于", _ABOUT_TEXT)
     
     def show_contact(self):
         """显示联系方式"""
-        contact_text = """联系方式：
-
-如有问题或建议，欢迎联系我们：
-- 邮箱：508125305@qq.com
-"""
-        QMessageBox.information(self, "联系方式", contact_text)
+        self._show_info("contact", "联系方式", _CONTACT_TEXT)
+    
+    def _show_info(self, key, title, text):
+        """显示信息弹窗，同一弹窗只创建一次
+        
+        Args:
+            key: 弹窗缓存键
+            title: 弹窗标题
+            text: 弹窗内容
+        """
+        msg_box = self._msg_boxes.get(key)
+        if msg_box is None:
+            msg_box = QMessageBox(self)
+            msg_box.setWindowTitle(title)
+            msg_box.setText(text)
+            msg_box.setIcon(QMessageBox.Icon.Information)
+            self._msg_boxes[key] = msg_box
+        msg_box.exec()
     
     def show_prompt_templates(self):
         """显示提示词模板弹窗"""
+        self._get_templates_dialog().exec()
+    
+    def _get_templates_dialog(self):
+        """获取提示词模板弹窗，首次调用时创建，之后复用
+        
+        Returns:
+            QDialog: 提示词模板弹窗
+        """
+        if self._templates_dialog is not None:
+            return self._templates_dialog
+        
         # 创建弹窗
         dialog = QDialog(self)
         dialog.setWindowTitle("提示词模板")
@@ -379,22 +665,22 @@ class MainWindow(QMainWindow):
             template_item_layout.setContentsMargins(5, 5, 5, 5)
             
             # 分类和描述
-            category_desc = QLabel(f"<b>{template['category']}</b>: {template['description']}")
-            category_desc.setStyleSheet("font-size: 10px;")
+            category_desc = QLabel(f"<b>{template.category}</b>: {template.description}")
+            category_desc.setStyleSheet(self._CATEGORY_CSS)
             category_desc.setWordWrap(True)
             template_item_layout.addWidget(category_desc)
             
             # 提示词内容
-            content_label = QLabel(template['content'])
-            content_label.setStyleSheet("font-size: 10px; background-color: #f5f5f5; padding: 5px; border-radius: 3px;")
+            content_label = QLabel(template.content)
+            content_label.setStyleSheet(self._CONTENT_CSS)
             content_label.setWordWrap(True)
             template_item_layout.addWidget(content_label)
             
             # 复制按钮
             copy_button = QPushButton("复制")
             copy_button.setFixedHeight(20)
-            copy_button.setStyleSheet("font-size: 9px; background-color: #2196F3; color: white; border: none; border-radius: 3px;")
-            copy_button.clicked.connect(lambda checked, c=template['content'], d=dialog: self.copy_to_clipboard(c, d))
+            copy_button.setStyleSheet(self._COPY_BTN_CSS)
+            copy_button.clicked.connect(lambda checked, c=template.content, d=dialog: self.copy_to_clipboard(c, d))
             template_item_layout.addWidget(copy_button)
             
             # 添加到容器
@@ -407,8 +693,8 @@ class MainWindow(QMainWindow):
         scroll_area.setWidget(template_container)
         main_layout.addWidget(scroll_area)
         
-        # 显示弹窗
-        dialog.exec()
+        self._templates_dialog = dialog
+        return dialog
     
     def copy_to_clipboard(self, text, dialog=None):
         """复制文本到剪贴板
@@ -436,6 +722,9 @@ class MainWindow(QMainWindow):
     
     def init_ui(self):
         """初始化用户界面"""
+        # 统一设置界面样式，控件通过objectName匹配
+        self.setStyleSheet(self.MAIN_QSS)
+        
         # 创建中央部件
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -447,25 +736,7 @@ class MainWindow(QMainWindow):
         
         # 创建标签页
         self.tab_widget = QTabWidget()
-        # 设置标签页样式，增强层次感
-        self.tab_widget.setStyleSheet("""QTabWidget::pane {
-            border: 1px solid #ccc;
-            border-radius: 4px;
-            background: white;
-        }
-        QTabBar::tab {
-            background: #f0f0f0;
-            border: 1px solid #ccc;
-            border-bottom-color: #ccc;
-            border-radius: 4px 4px 0 0;
-            padding: 3px 8px;
-            margin-right: 1px;
-            font-size: 11px;
-        }
-        QTabBar::tab:selected {
-            background: white;
-            border-bottom-color: white;
-        }""")
+        self.tab_widget.setObjectName("mainTabs")
         main_layout.addWidget(self.tab_widget)
         
         # API设置标签页
@@ -478,7 +749,7 @@ class MainWindow(QMainWindow):
         service_layout = QHBoxLayout()
         service_label = QLabel("AI服务:")
         service_label.setFixedWidth(60)
-        service_label.setStyleSheet("font-size: 11px;")
+        service_label.setObjectName("fieldLabel")
         service_layout.addWidget(service_label)
         self.ai_service_combo = QComboBox()
         self.ai_service_combo.addItem("DeepSeek", "deepseek")
@@ -486,7 +757,7 @@ class MainWindow(QMainWindow):
         self.ai_service_combo.addItem("Kimi", "kimi")
         self.ai_service_combo.addItem("通义千问", "qianwen")
         self.ai_service_combo.setFixedHeight(25)
-        self.ai_service_combo.setStyleSheet("font-size: 11px;")
+        self.ai_service_combo.setObjectName("fieldInput")
         self.ai_service_combo.currentIndexChanged.connect(self.on_ai_service_changed)
         service_layout.addWidget(self.ai_service_combo)
         service_layout.addStretch()
@@ -497,12 +768,12 @@ class MainWindow(QMainWindow):
         key_layout = QHBoxLayout()
         key_label = QLabel("API密钥:")
         key_label.setFixedWidth(60)
-        key_label.setStyleSheet("font-size: 11px;")
+        key_label.setObjectName("fieldLabel")
         key_layout.addWidget(key_label)
         self.api_key_input = QLineEdit()
         self.api_key_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.api_key_input.setFixedHeight(20)
-        self.api_key_input.setStyleSheet("font-size: 11px;")
+        self.api_key_input.setObjectName("fieldInput")
         key_layout.addWidget(self.api_key_input)
         
         # 验证按钮
@@ -510,14 +781,14 @@ class MainWindow(QMainWindow):
         self.validate_button.clicked.connect(self.validate_api_key)
         self.validate_button.setFixedWidth(50)
         self.validate_button.setFixedHeight(20)
-        self.validate_button.setStyleSheet("font-size: 10px;")
+        self.validate_button.setObjectName("smallButton")
         key_layout.addWidget(self.validate_button)
         
         api_layout.addLayout(key_layout)
         
         # 状态标签
         self.api_status_label = QLabel("请选择AI服务并输入API密钥")
-        self.api_status_label.setStyleSheet("font-size: 10px; color: #666;")
+        self.api_status_label.setObjectName("apiStatusLabel")
         api_layout.addWidget(self.api_status_label)
         
         self.tab_widget.addTab(api_tab, "API设置")
@@ -532,11 +803,11 @@ class MainWindow(QMainWindow):
         path_layout = QHBoxLayout()
         path_label = QLabel("文档路径:")
         path_label.setFixedWidth(60)
-        path_label.setStyleSheet("font-size: 11px;")
+        path_label.setObjectName("fieldLabel")
         path_layout.addWidget(path_label)
         self.doc_path_input = QLineEdit()
         self.doc_path_input.setFixedHeight(20)
-        self.doc_path_input.setStyleSheet("font-size: 11px;")
+        self.doc_path_input.setObjectName("fieldInput")
         path_layout.addWidget(self.doc_path_input)
         
         # 浏览按钮
@@ -544,7 +815,7 @@ class MainWindow(QMainWindow):
         browse_button.clicked.connect(self.browse_document)
         browse_button.setFixedWidth(40)
         browse_button.setFixedHeight(20)
-        browse_button.setStyleSheet("font-size: 10px;")
+        browse_button.setObjectName("smallButton")
         path_layout.addWidget(browse_button)
         
         doc_layout.addLayout(path_layout)
@@ -553,14 +824,14 @@ class MainWindow(QMainWindow):
         write_mode_layout = QHBoxLayout()
         write_mode_label = QLabel("写入模式:")
         write_mode_label.setFixedWidth(70)
-        write_mode_label.setStyleSheet("font-size: 11px;")
+        write_mode_label.setObjectName("fieldLabel")
         write_mode_layout.addWidget(write_mode_label)
         self.write_mode_combo = QComboBox()
         self.write_mode_combo.addItem("增量写入", "incremental")
         self.write_mode_combo.addItem("全量重写", "overwrite")
         self.write_mode_combo.addItem("光标补写", "cursor")
         self.write_mode_combo.setFixedHeight(25)
-        self.write_mode_combo.setStyleSheet("font-size: 11px;")
+        self.write_mode_combo.setObjectName("fieldInput")
         write_mode_layout.addWidget(self.write_mode_combo)
         write_mode_layout.addStretch()
         
@@ -570,11 +841,11 @@ class MainWindow(QMainWindow):
         effect_layout = QHBoxLayout()
         effect_label = QLabel("动态效果:")
         effect_label.setFixedWidth(70)
-        effect_label.setStyleSheet("font-size: 11px;")
+        effect_label.setObjectName("fieldLabel")
         effect_layout.addWidget(effect_label)
         self.dynamic_effects_checkbox = QCheckBox()
         self.dynamic_effects_checkbox.setChecked(True)  # 默认开启
-        self.dynamic_effects_checkbox.setStyleSheet("font-size: 11px;")
+        self.dynamic_effects_checkbox.setObjectName("fieldInput")
         effect_layout.addWidget(self.dynamic_effects_checkbox)
         effect_layout.addStretch()
         
@@ -592,14 +863,14 @@ class MainWindow(QMainWindow):
         
         # 提示词说明
         prompt_desc = QLabel("主题提示词")
-        prompt_desc.setStyleSheet("font-weight: bold; font-size: 11px;")
+        prompt_desc.setObjectName("sectionTitle")
         prompt_layout.addWidget(prompt_desc)
         
         # 提示词输入
         self.template_editor = QTextEdit()
         self.template_editor.setMinimumHeight(100)
         self.template_editor.setPlaceholderText("指导AI补写的方向和风格")
-        self.template_editor.setStyleSheet("font-size: 11px;")
+        self.template_editor.setObjectName("fieldInput")
         prompt_layout.addWidget(self.template_editor)
         
         self.tab_widget.addTab(prompt_tab, "主题提示词")
@@ -614,28 +885,28 @@ class MainWindow(QMainWindow):
         usage_button = QPushButton("使用说明")
         usage_button.clicked.connect(self.show_usage)
         usage_button.setFixedHeight(30)
-        usage_button.setStyleSheet("font-size: 12px;")
+        usage_button.setObjectName("helpButton")
         help_layout.addWidget(usage_button)
         
         # 关于按钮
         about_button = QPushButton("关于")
         about_button.clicked.connect(self.show_about)
         about_button.setFixedHeight(30)
-        about_button.setStyleSheet("font-size: 12px;")
+        about_button.setObjectName("helpButton")
         help_layout.addWidget(about_button)
         
         # 联系方式按钮
         contact_button = QPushButton("联系方式")
         contact_button.clicked.connect(self.show_contact)
         contact_button.setFixedHeight(30)
-        contact_button.setStyleSheet("font-size: 12px;")
+        contact_button.setObjectName("helpButton")
         help_layout.addWidget(contact_button)
         
         # 提示词模板按钮
         template_button = QPushButton("提示词模板")
         template_button.clicked.connect(self.show_prompt_templates)
         template_button.setFixedHeight(30)
-        template_button.setStyleSheet("font-size: 12px;")
+        template_button.setObjectName("helpButton")
         help_layout.addWidget(template_button)
         
         # 占位符，使按钮居中显示
@@ -652,72 +923,61 @@ class MainWindow(QMainWindow):
         self.minimize_button.setFixedWidth(80)
         self.minimize_button.setFixedHeight(28)
         self.minimize_button.clicked.connect(self.toggle_minimize)
-        self.minimize_button.setStyleSheet("""QPushButton {
-            background-color: #2196F3;
-            color: white;
-            border: none;
-            border-radius: 3px;
-            padding: 5px 10px;
-            font-size: 12px;
-        }
-        QPushButton:hover {
-            background-color: #1976D2;
-        }""")
+        self.minimize_button.setObjectName("minimizeButton")
         button_layout.addWidget(self.minimize_button)
         
         self.save_button = QPushButton("保存配置")
         self.save_button.setFixedWidth(100)
         self.save_button.setFixedHeight(28)
         self.save_button.clicked.connect(self.save_config)
-        self.save_button.setStyleSheet("""QPushButton {
-            background-color: #4CAF50;
-            color: white;
-            border: none;
-            border-radius: 3px;
-            padding: 5px 10px;
-            font-size: 12px;
-        }
-        QPushButton:hover {
-            background-color: #45a049;
-        }""")
+        self.save_button.setObjectName("saveButton")
         button_layout.addWidget(self.save_button)
         
         main_layout.addLayout(button_layout)
     
     def load_config_to_ui(self):
         """加载配置到UI界面"""
-        # 加载AI服务类型
-        ai_service = self.config.get('ai_service', 'deepseek')
-        index = self.ai_service_combo.findData(ai_service)
-        if index >= 0:
-            self.ai_service_combo.setCurrentIndex(index)
-        
-        # 加载对应服务的API密钥
-        api_key = self.config.get(f"{ai_service}_api_key", "")
-        self.api_key_input.setText(api_key)
-        
-        # 加载文档路径
-        if 'document_path' in self.config:
-            self.doc_path_input.setText(self.config['document_path'])
-        
-        # 加载写入模式
-        if 'write_mode' in self.config:
-            write_mode = self.config['write_mode']
-            index = self.write_mode_combo.findData(write_mode)
+        # 加载期间屏蔽控件信号，避免逐项触发变更处理
+        # AI服务切换的处理函数也不会触发，API密钥在下面直接加载
+        with QSignalBlocker(self.ai_service_combo), QSignalBlocker(self.api_key_input), \
+                QSignalBlocker(self.doc_path_input), QSignalBlocker(self.write_mode_combo), \
+                QSignalBlocker(self.dynamic_effects_checkbox), QSignalBlocker(self.template_editor):
+            # 加载AI服务类型
+            ai_service = self.config.get('ai_service', 'deepseek')
+            index = self.ai_service_combo.findData(ai_service)
             if index >= 0:
-                self.write_mode_combo.setCurrentIndex(index)
-        
-        # 加载动态效果开关
-        if 'dynamic_effects_enabled' in self.config:
-            self.dynamic_effects_checkbox.setChecked(self.config['dynamic_effects_enabled'])
-            self.minimize_ball.set_dynamic_effects(self.config['dynamic_effects_enabled'])
-        else:
-            self.dynamic_effects_checkbox.setChecked(True)  # 默认开启
-            self.minimize_ball.set_dynamic_effects(True)
-        
-        # 加载主题提示词
-        if 'templates' in self.config and 'default' in self.config['templates']:
-            self.template_editor.setPlainText(self.config['templates']['default'])
+                self.ai_service_combo.setCurrentIndex(index)
+            
+            # 加载对应服务的API密钥
+            api_key = self.config.get(f"{ai_service}_api_key", "")
+            self.api_key_input.setText(api_key)
+            
+            # 加载文档路径
+            if 'document_path' in self.config:
+                self.doc_path_input.setText(self.config['document_path'])
+            
+            # 加载写入模式
+            if 'write_mode' in self.config:
+                write_mode = self.config['write_mode']
+                index = self.write_mode_combo.findData(write_mode)
+                if index >= 0:
+                    self.write_mode_combo.setCurrentIndex(index)
+            
+            # 加载动态效果开关
+            if 'dynamic_effects_enabled' in self.config:
+                self.dynamic_effects_checkbox.setChecked(self.config['dynamic_effects_enabled'])
+                self.minimize_ball.set_dynamic_effects(self.config['dynamic_effects_enabled'])
+            else:
+                self.dynamic_effects_checkbox.setChecked(True)  # 默认开启
+                self.minimize_ball.set_dynamic_effects(True)
+            
+            # 加载主题提示词
+            if 'templates' in self.config and 'default' in self.config['templates']:
+                # 初始加载不需要撤销记录
+                document = self.template_editor.document()
+                document.setUndoRedoEnabled(False)
+                self.template_editor.setPlainText(self.config['templates']['default'])
+                document.setUndoRedoEnabled(True)
     
     def on_ai_service_changed(self):
         """AI服务选择改变时的处理"""
@@ -759,15 +1019,20 @@ class MainWindow(QMainWindow):
     
     def browse_document(self):
         """浏览并选择文档"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "选择文档文件",
-            "",
-            "所有文件 (*);;文本文件 (*.txt);;Markdown文件 (*.md);;Word文档 (*.docx)"
-        )
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self, "选择文档文件", "", _DOC_FILTERS)
+            self._file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            self._file_dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+            # Windows原生对话框会启动资源管理器外壳，打开时阻塞事件循环，改用Qt自带对话框
+            if sys.platform == "win32":
+                self._file_dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
+        
+        if not self._file_dialog.exec():
+            return
         
-        if file_path:
-            self.doc_path_input.setText(file_path)
+        selected_files = self._file_dialog.selectedFiles()
+        if selected_files:
+            self.doc_path_input.setText(selected_files[0])
     
     def save_config(self):
         """保存所有配置"""
@@ -853,23 +1118,29 @@ class MainWindow(QMainWindow):
         monitor_service.processing_started.connect(self.on_processing_started)
         monitor_service.processing_completed.connect(self.on_processing_completed)
         monitor_service.processing_failed.connect(self.on_processing_failed)
-        # 连接进度更新信号到最小化球
-        monitor_service.progress_updated.connect(self.on_progress_updated)
+        # 连接进度更新信号到最小化球（监听线程发出，排队到界面线程处理）
+        monitor_service.progress_updated.connect(
+            self.on_progress_updated, Qt.ConnectionType.QueuedConnection
+        )
     
     def on_progress_updated(self, progress_text):
         """处理进度更新信号"""
-        # 在最小化球上显示进度信息
-        self.minimize_ball.set_progress(progress_text)
-        
-        # 根据进度文本设置状态
-        if "处理中" in progress_text or "生成中" in progress_text or "写入中" in progress_text:
-            self.minimize_ball.set_status(self.minimize_ball.STATUS_PROCESSING)
-        elif "已完成" in progress_text or "成功" in progress_text:
-            self.minimize_ball.set_status(self.minimize_ball.STATUS_COMPLETED)
-        elif "已失败" in progress_text or "错误" in progress_text:
-            self.minimize_ball.set_status(self.minimize_ball.STATUS_ERROR)
-        else:
-            self.minimize_ball.set_status(self.minimize_ball.STATUS_STANDBY)
+        # 根据进度文本确定状态，未匹配任何关键字时为待机状态
+        status = MinimizeBall.STATUS_STANDBY
+        for keywords, keyword_status in self._STATUS_KEYWORDS:
+            if any(keyword in progress_text for keyword in keywords):
+                status = keyword_status
+                break
+        
+        # 限制中间进度的刷新频率，完成、失败等最终状态始终显示
+        now = time.monotonic()
+        if (status == MinimizeBall.STATUS_PROCESSING
+                and now - self._last_progress_ts < self._progress_throttle_ms / 1000):
+            return
+        self._last_progress_ts = now
+        
+        # 在最小化球上显示进度信息和状态
+        self.minimize_ball.set_progress_status(progress_text, status)
     
     def closeEvent(self, event):
         """窗口关闭事件
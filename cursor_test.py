@@ -8,10 +8,13 @@
 import os
 import sys
 
+# 项目根目录
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
 # 添加项目根目录到Python路径
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _HERE)
 
-from ai_write_helper.services.document import DocumentService
+from ai_write_helper.services.document import CURSOR_MARKER, DocumentService
 from ai_write_helper.core.config_manager import ConfigManager
 
 
@@ -27,7 +30,7 @@ def test_cursor_insertion():
     test_txt_file = "test_cursor.txt"
     
     # 写入初始内容
-    initial_content = "这是一个测试文档。\n光标应该在这里：[CURSOR]\n这是文档的结尾。"
+    initial_content = f"这是一个测试文档。\n光标应该在这里：{CURSOR_MARKER}\n这是文档的结尾。"
     with open(test_txt_file, 'w', encoding='utf-8') as f:
         f.write(initial_content)
     
@@ -40,17 +43,16 @@ def test_cursor_insertion():
     with open(test_txt_file, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    # 查找光标标记
-    cursor_pos = content.find("[CURSOR]")
-    if cursor_pos != -1:
-        # 在光标位置插入内容
-        new_content = content[:cursor_pos] + insert_content + content[cursor_pos+8:]
-        
+    # 替换第一个光标标记，内容不变说明未找到标记
+    new_content = content.replace(CURSOR_MARKER, insert_content, 1)
+    if new_content != content:
         print(f"\n插入后的内容：\n{new_content}")
         
-        # 写入新内容
-        with open(test_txt_file, 'w', encoding='utf-8') as f:
+        # 先写入临时文件再原子替换，避免中途崩溃留下半截文件
+        temp_file = test_txt_file + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
             f.write(new_content)
+        os.replace(temp_file, test_txt_file)
     
     # 清理测试文件
     if os.path.exists(test_txt_file):
@@ -11,23 +11,59 @@
 import os
 import sys
 import signal
+import socket
 import logging
-import traceback
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer, QCoreApplication, QMetaObject, Qt
-from PyQt6.QtWidgets import QMainWindow
-from PyQt6.QtCore import QThread, pyqtSignal
+import threading
+from typing import Protocol, runtime_checkable
+
+# 项目根目录
+_HERE = os.path.dirname(os.path.abspath(__file__))
 
 # 添加项目根目录到Python路径
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _HERE)
+
+# 限制数值计算库的默认线程数，避免与Qt界面线程和监听线程争用CPU；
+# 必须在导入PyQt6、NumPy等第三方模块之前设置，已有的环境变量优先
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+os.environ.setdefault("NUMBA_NUM_THREADS", str(max(1, (os.cpu_count() or 2) // 2)))
+
+# PyQt6及各服务模块在用到时才导入，缩短启动时间
+
+# 触发应用退出的信号
+EXIT_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+
+# POSIX系统：退出信号被所有线程屏蔽，只由专用线程通过sigwait同步接收。
+# 屏蔽字会被子进程继承，目前唯一的子进程是macOS上读取剪贴板的pbpaste，
+# 它读完即退出，不依赖SIGINT/SIGTERM，且无法屏蔽的SIGKILL仍可终止它
+_USE_SIGWAIT = hasattr(signal, 'pthread_sigmask') and hasattr(signal, 'sigwait')
+
+# 收到退出信号后等待正常退出的时间（秒），超时则强制退出
+FORCE_EXIT_TIMEOUT = 1.0
+
+# 变更后需要重建服务组件的配置项（各服务的API密钥以"_api_key"结尾）
+SERVICE_CONFIG_KEYS = frozenset({"ai_service", "api_key", "document_path"})
 
-from ai_write_helper.core.log_manager import LogManager
-from ai_write_helper.core.config_manager import ConfigManager
-from ai_write_helper.core.exceptions import AIWriteHelperError
-from ai_write_helper.services.monitor import TextMonitorService
-from ai_write_helper.services.api import APIService
-from ai_write_helper.services.document import DocumentService
-from ai_write_helper.ui.main_window import MainWindow
+
+def _is_service_config_key(key):
+    """判断配置项变更后是否需要重建服务组件
+    
+    Args:
+        key: 配置项名称
+        
+    Returns:
+        bool: 需要重建服务时返回True
+    """
+    return key in SERVICE_CONFIG_KEYS or key.endswith("_api_key")
+
+
+@runtime_checkable
+class Stoppable(Protocol):
+    """可停止的后台服务接口"""
+    
+    def is_running(self) -> bool: ...
+    
+    def stop(self) -> None: ...
 
 
 class AIWriteHelperApplication:
@@ -43,12 +79,21 @@ class AIWriteHelperApplication:
         self.app_version = "1.0.0"
         
         # 初始化组件
+        self.qt_app = None
         self.log_manager = None
         self.config_manager = None
         self.document_service = None
         self.api_service = None
         self.monitor_service = None
         self.main_window = None
+        self._services_initialized = False
+        self._exit_watchdog = None
+        
+        # 退出信号处理（POSIX系统使用sigwait线程，其他系统使用wakeup fd）
+        self._signal_thread = None
+        self._signal_rsock = None
+        self._signal_wsock = None
+        self._signal_notifier = None
         # 移除托盘图标引用
         
         # 应用运行状态
@@ -60,6 +105,10 @@ class AIWriteHelperApplication:
         Returns:
             bool: 初始化是否成功
         """
+        # 在创建任何线程之前屏蔽退出信号，之后创建的线程都继承该屏蔽字
+        if _USE_SIGWAIT:
+            signal.pthread_sigmask(signal.SIG_BLOCK, EXIT_SIGNALS)
+        
         try:
             # 初始化日志系统
             self._init_logging()
@@ -87,28 +136,44 @@ class AIWriteHelperApplication:
         except Exception as e:
             # 如果日志系统已初始化，则使用logging记录错误
             if self.log_manager:
-                logging.critical(f"应用初始化失败: {str(e)}")
-                logging.critical(traceback.format_exc())
+                logging.critical(f"应用初始化失败: {str(e)}", exc_info=True)
             else:
                 # 日志系统未初始化，直接打印错误
+                import traceback
+                
                 print(f"严重错误: 无法初始化应用: {str(e)}")
-                print(traceback.format_exc())
+                traceback.print_exc()
             return False
     
     def _init_logging(self):
         """初始化日志系统"""
+        from ai_write_helper.core.log_manager import LogManager
+        
         self.log_manager = LogManager()
         self.log_manager.configure_root_logger()
     
     def _init_config(self):
         """初始化配置管理器"""
+        from ai_write_helper.core.config_manager import ConfigManager
+        
         self.config_manager = ConfigManager()
         # 直接加载配置，ConfigManager内部会处理默认配置逻辑
         self.config = self.config_manager.load_config()
         logging.info("配置已加载")
     
-    def _init_services(self):
-        """初始化服务组件"""
+    def _init_services(self, force=False):
+        """初始化服务组件
+        
+        Args:
+            force: 服务已初始化时是否仍然重建
+        """
+        if self._services_initialized and not force:
+            return
+        
+        from ai_write_helper.services.monitor import TextMonitorService
+        from ai_write_helper.services.api import APIService
+        from ai_write_helper.services.document import DocumentService
+        
         # 初始化文档服务
         self.document_service = DocumentService(self.config_manager)
         
@@ -121,9 +186,25 @@ class AIWriteHelperApplication:
             api_service=self.api_service,
             document_service=self.document_service
         )
+        self._services_initialized = True
     
     def _init_ui(self):
         """初始化UI组件"""
+        from PyQt6.QtWidgets import QApplication
+        
+        # 确保只创建一个QApplication实例，且在导入任何窗口部件之前创建
+        self.qt_app = QApplication.instance()
+        if self.qt_app is None:
+            # 设置应用信息
+            QApplication.setApplicationName(self.app_name)
+            QApplication.setOrganizationName("AI Writing Helper")
+            QApplication.setApplicationVersion(self.app_version)
+            
+            # 创建应用实例（保留引用，防止被垃圾回收）
+            self.qt_app = QApplication(sys.argv)
+        
+        from ai_write_helper.ui.main_window import MainWindow
+        
         # 创建主窗口
         self.main_window = MainWindow(self.config_manager, self.api_service, self.document_service)
         
@@ -139,7 +220,10 @@ class AIWriteHelperApplication:
         if self.main_window and self.config_manager:
             self.main_window.config_saved.connect(self._on_config_updated)
         
-        # 连接监控服务信号到主窗口
+        self._connect_monitor_signals()
+    
+    def _connect_monitor_signals(self):
+        """连接监控服务信号到主窗口"""
         if self.main_window and self.monitor_service:
             self.main_window.connect_monitor_signals(self.monitor_service)
             
@@ -148,30 +232,68 @@ class AIWriteHelperApplication:
     
     def _on_config_updated(self):
         """配置更新时的处理函数"""
-        logging.info("配置已更新，重新初始化服务")
-        
         try:
-            # 获取最新配置
-            self.config = self.config_manager.load_config()
+            # 获取最新配置，与上一次的配置比较找出变更项
+            old_config = self.config or {}
+            new_config = self.config_manager.load_config()
+            changed_keys = {
+                key for key in old_config.keys() | new_config.keys()
+                if old_config.get(key) != new_config.get(key)
+            }
+            self.config = new_config
+            
+            # 各服务在使用时才从config_manager读取配置，
+            # 只有服务相关的配置项变更时才需要重建服务
+            if not any(_is_service_config_key(key) for key in changed_keys):
+                logging.info("配置已更新，服务无需重新初始化")
+                return
+            
+            logging.info("服务相关配置已更新，重新初始化服务")
+            
+            # 停止旧的监控服务，避免监听器重复运行
+            if self.monitor_service and self.monitor_service.is_running():
+                self.monitor_service.stop()
             
             # 重新初始化服务
-            self._init_services()
+            self._init_services(force=True)
             
-            # 重新连接信号
-            self._connect_signals()
+            # 重新连接监控服务信号（配置更新信号已连接，无需重复连接）
+            self._connect_monitor_signals()
             
             # 启动监控服务
             self.monitor_service.start()
                 
             logging.info("服务重新初始化成功")
         except Exception as e:
-            logging.error(f"重新初始化服务失败: {str(e)}")
-            logging.error(traceback.format_exc())
+            logging.error(f"重新初始化服务失败: {str(e)}", exc_info=True)
     
 
 
     def _register_exit_handlers(self):
         """注册应用退出处理函数"""
+        # POSIX系统：退出信号已在initialize()中屏蔽，由专用线程同步等待处理
+        if _USE_SIGWAIT:
+            self._signal_thread = threading.Thread(
+                target=self._wait_for_exit_signal,
+                name="exit-signal-waiter",
+                daemon=True
+            )
+            self._signal_thread.start()
+            return
+        
+        from PyQt6.QtCore import QSocketNotifier
+        
+        # Qt事件循环运行期间Python信号处理函数无法及时执行，
+        # 通过wakeup fd在收到信号时唤醒事件循环
+        self._signal_rsock, self._signal_wsock = socket.socketpair()
+        self._signal_rsock.setblocking(False)
+        self._signal_wsock.setblocking(False)
+        signal.set_wakeup_fd(self._signal_wsock.fileno())
+        self._signal_notifier = QSocketNotifier(
+            self._signal_rsock.fileno(), QSocketNotifier.Type.Read
+        )
+        self._signal_notifier.activated.connect(self._drain_signal_socket)
+        
         # 注册信号处理函数
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -180,13 +302,37 @@ class AIWriteHelperApplication:
         if hasattr(signal, 'SIGBREAK'):
             signal.signal(signal.SIGBREAK, self._signal_handler)
     
+    def _wait_for_exit_signal(self):
+        """等待退出信号的线程函数（仅POSIX系统）"""
+        while True:
+            sig = signal.sigwait(EXIT_SIGNALS)
+            self._request_exit(sig)
+    
+    def _drain_signal_socket(self):
+        """清空信号唤醒socket，信号处理函数随后在主线程中执行"""
+        try:
+            while self._signal_rsock.recv(64):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+    
     def _signal_handler(self, sig, frame):
-        """信号处理函数
+        """信号处理函数（非POSIX系统）
         
         Args:
             sig (int): 信号编号
             frame: 当前栈帧
         """
+        self._request_exit(sig)
+    
+    def _request_exit(self, sig):
+        """请求Qt主线程退出，并在超时后强制退出
+        
+        Args:
+            sig (int): 信号编号
+        """
+        from PyQt6.QtCore import QCoreApplication, QMetaObject, Qt
+        
         signal_name = signal.Signals(sig).name if hasattr(signal, 'Signals') else str(sig)
         logging.info(f"接收到信号 {signal_name}，准备退出应用")
         
@@ -197,19 +343,25 @@ class AIWriteHelperApplication:
             Qt.ConnectionType.QueuedConnection
         )
         
-        # 确保程序能够退出
-        import threading
-        def force_exit():
-            import time
-            time.sleep(1)  # 给应用1秒时间正常退出
-            logging.critical("强制退出应用...")
-            import os
-            os._exit(1)  # 强制退出
-        
-        # 启动一个线程来确保应用退出
-        exit_thread = threading.Thread(target=force_exit)
-        exit_thread.daemon = True
-        exit_thread.start()
+        # 确保程序能够退出，给应用FORCE_EXIT_TIMEOUT秒时间正常退出
+        self._arm_exit_watchdog()
+    
+    def _arm_exit_watchdog(self):
+        """启动强制退出的看门狗，独立于Qt事件循环
+        
+        事件循环退出后的cleanup和监听线程join卡住时同样有效；
+        重复收到退出信号时不会推迟已设定的退出时间。
+        """
+        # 只创建一次计时线程，超时后记录日志并以退出码1强制退出
+        if self._exit_watchdog is None:
+            self._exit_watchdog = threading.Timer(FORCE_EXIT_TIMEOUT, self._force_exit)
+            self._exit_watchdog.daemon = True
+            self._exit_watchdog.start()
+    
+    def _force_exit(self):
+        """强制退出应用"""
+        logging.critical("强制退出应用...")
+        os._exit(1)
     
     def start(self):
         """启动应用程序
@@ -228,17 +380,15 @@ class AIWriteHelperApplication:
             self.monitor_service.start()
             logging.info("文本监控服务已启动")
         except Exception as e:
-            logging.error(f"启动监控服务失败: {str(e)}")
-            logging.error(traceback.format_exc())
+            logging.error(f"启动监控服务失败: {str(e)}", exc_info=True)
         
         # 进入应用主循环
         try:
             # 应用主循环
-            return QApplication.instance().exec()
+            return self.qt_app.exec()
             
         except Exception as e:
-            logging.critical(f"应用运行出错: {str(e)}")
-            logging.critical(traceback.format_exc())
+            logging.critical(f"应用运行出错: {str(e)}", exc_info=True)
             return 1
         finally:
             # 清理资源
@@ -246,15 +396,16 @@ class AIWriteHelperApplication:
     
     def quit(self):
         """优雅退出应用"""
+        from PyQt6.QtCore import QCoreApplication
+        
         logging.info("准备退出应用...")
         
         # 停止监控服务
-        if self.monitor_service:
+        monitor_service = self.monitor_service
+        if isinstance(monitor_service, Stoppable):
             try:
-                # 检查is_running属性是否存在
-                is_running = hasattr(self.monitor_service, 'is_running') and callable(getattr(self.monitor_service, 'is_running')) and self.monitor_service.is_running()
-                if is_running:
-                    self.monitor_service.stop()
+                if monitor_service.is_running():
+                    monitor_service.stop()
                     logging.info("文本监控服务已停止")
             except Exception as e:
                 logging.error(f"停止监控服务时出错: {str(e)}")
@@ -280,7 +431,9 @@ class AIWriteHelperApplication:
             if self.config_manager and hasattr(self, 'config'):
                 try:
                     self.config_manager.save_config(self.config)
-                    logging.info("配置已保存")
+                    # 立即写入尚未落盘的配置
+                    if self.config_manager.flush():
+                        logging.info("配置已保存")
                 except Exception as e:
                     logging.error(f"保存配置时出错: {str(e)}")
             
@@ -299,18 +452,7 @@ class AIWriteHelperApplication:
 
 def main():
     """应用主函数"""
-    # 确保只创建一个QApplication实例
-    app = QApplication.instance()
-    if not app:
-        # 设置应用信息
-        QApplication.setApplicationName("AI写作助手")
-        QApplication.setOrganizationName("AI Writing Helper")
-        QApplication.setApplicationVersion("1.0.0")
-        
-        # 创建应用实例
-        app = QApplication(sys.argv)
-    
-    # 创建并启动应用
+    # 创建并启动应用（QApplication在_init_ui中按需创建）
     ai_app = AIWriteHelperApplication()
     exit_code = ai_app.start()
     